@@ -1,12 +1,118 @@
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, 
                              QGridLayout, QLabel, QFrame, QPushButton,
-                             QVBoxLayout, QHBoxLayout, QSlider, QScrollArea, QSizePolicy, QStyle)
-from PySide6.QtCore import Qt, QUrl, Slot, Signal, QPropertyAnimation, QEasingCurve, Property, QPoint, QRect
-from PySide6.QtGui import QPixmap, QIcon, QDragEnterEvent, QDropEvent
+                             QVBoxLayout, QHBoxLayout, QSlider, QScrollArea, QSizePolicy, QStyle,
+                             QStackedWidget)
+from PySide6.QtCore import (Qt, QUrl, Slot, Signal, QPropertyAnimation, QEasingCurve, Property,
+                            QObject, QRunnable, QThreadPool, QTimer)
+from PySide6.QtGui import QPixmap, QPixmapCache, QIcon, QDragEnterEvent, QDropEvent
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from mutagen import File
-from mutagen.id3 import ID3
+from mutagen.id3 import ID3, ID3NoHeaderError, TIT2, APIC, USLT, SYLT
+from mutagen.flac import FLAC
+from mutagen.wave import WAVE
 import io
+import os
+import re
+import bisect
+
+# LRC 时间标签 [mm:ss] / [mm:ss.xx]
+_TS_RE = re.compile(r'\[(\d+):(\d+(?:\.\d+)?)\]')
+# 一组时间标签（标签之间允许空白）及该行其余的歌词文本
+_LINE_RE = re.compile(r'((?:\[\d+:\d+(?:\.\d+)?\][ \t]*)+)([^\n]*)')
+
+def _sylt_to_lrc(frame):
+    # SYLT 歌词为 [(文本, 时间), ...]，转换为 LRC 文本以便统一解析
+    # 只支持以毫秒计时（format == 2）的帧，按 MPEG 帧计时的无法换算，直接跳过
+    if frame.format != 2:
+        return None
+    lines = []
+    for text, ms in frame.text:
+        # 用整数运算拆分时间，避免四舍五入出现 [mm:60.00]
+        lines.append(f"[{ms // 60000:02d}:{ms // 1000 % 60:02d}.{ms // 10 % 100:02d}]{text.strip()}")
+    return '\n'.join(lines)
+
+# ID3 帧类型 -> (元数据键, 取值函数)；封面只保存原始数据，QPixmap 需在 GUI 线程创建
+_FRAME_HANDLERS = {
+    TIT2: ('title', str),
+    APIC: ('cover_bytes', lambda frame: frame.data),
+    USLT: ('lyrics', lambda frame: frame.text),
+    SYLT: ('lyrics', _sylt_to_lrc),
+}
+
+# 扩展名 -> 标签读取函数；mp3 只读 ID3，不解析 MPEG 帧信息
+_TAG_LOADERS = {
+    '.mp3': ID3,
+    '.wav': lambda path: WAVE(path).tags,
+    '.flac': lambda path: FLAC(path).tags,
+}
+
+def load_tags(path):
+    """按扩展名直接选择读取器，跳过 mutagen.File 的格式嗅探，失败时再回退到 mutagen.File"""
+    loader = _TAG_LOADERS.get(os.path.splitext(path)[1].lower())
+    if loader:
+        try:
+            return loader(path)
+        except ID3NoHeaderError:
+            # 没有 ID3 标签
+            return None
+        except Exception:
+            pass
+    audio = File(path)
+    return audio.tags if audio is not None else None
+
+def parse_tags(path):
+    """解析音频文件的标签，返回 {'title', 'cover_bytes', 'lyrics'}（可在工作线程中调用）"""
+    metadata = {}
+    try:
+        tags = load_tags(path)
+        # 只有 ID3 标签（mp3/wav）包含封面和歌词帧，flac 只使用文件名
+        if isinstance(tags, ID3):
+            # 只遍历一次所有帧，按帧类型取标题、封面和歌词，同类帧以第一个为准
+            for frame in tags.values():
+                handler = _FRAME_HANDLERS.get(type(frame))
+                if handler:
+                    key, extract = handler
+                    if key not in metadata:
+                        value = extract(frame)
+                        # 无法解析的帧返回 None，留给后面的同类帧
+                        if value is not None:
+                            metadata[key] = value
+    except Exception as e:
+        print(f"Error loading metadata: {e}")
+    
+    # 如果没有找到标题，使用文件名
+    if 'title' not in metadata:
+        metadata['title'] = os.path.basename(path)
+    return metadata
+
+def get_cover_pixmap(key, source, scale_mode=Qt.FastTransformation):
+    """获取缩放到 150x150 的封面，source 为图片路径或原始图片数据，结果缓存在 QPixmapCache"""
+    if scale_mode == Qt.SmoothTransformation:
+        key += ":smooth"
+    pixmap = QPixmap()
+    if QPixmapCache.find(key, pixmap):
+        return pixmap
+    
+    if isinstance(source, str):
+        pixmap.load(source)
+    else:
+        pixmap.loadFromData(source)
+    pixmap = pixmap.scaled(150, 150, Qt.KeepAspectRatio, scale_mode)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+class MetadataSignals(QObject):
+    tagsReady = Signal(str, dict)  # (音乐路径, 元数据)
+
+class MetadataWorker(QRunnable):
+    """在线程池中解析标签，完成后通过信号把结果送回 GUI 线程"""
+    def __init__(self, music_path):
+        super().__init__()
+        self.music_path = music_path
+        self.signals = MetadataSignals()
+    
+    def run(self):
+        self.signals.tagsReady.emit(self.music_path, parse_tags(self.music_path))
 
 class TileWidget(QFrame):
     def __init__(self, title=""):
@@ -31,7 +137,10 @@ class AlbumTile(TileWidget):
     def __init__(self, title="", cover_path=None, music_path=None, is_current_playing=False):
         super().__init__(title)
         self.music_path = music_path
+        self.basename = os.path.basename(music_path) if music_path else ""
         self.metadata = {}
+        self._cover_loaded = False
+        self._cover_mode = Qt.FastTransformation
         self.is_current_playing = is_current_playing
         self.setup_ui(cover_path)
         if music_path:
@@ -39,9 +148,7 @@ class AlbumTile(TileWidget):
     
     def setup_ui(self, cover_path):
         if cover_path:
-            pixmap = QPixmap(cover_path)
-            scaled_pixmap = pixmap.scaled(150, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.label.setPixmap(scaled_pixmap)
+            self.label.setPixmap(get_cover_pixmap(cover_path, cover_path))
         self.setMinimumSize(200, 200)
         self.setAcceptDrops(True)  # 允许拖放
     
@@ -55,58 +162,43 @@ class AlbumTile(TileWidget):
             file_path = files[0].toLocalFile()
             if file_path.lower().endswith(('.mp3', '.wav', '.flac')):
                 self.music_path = file_path
-                self.label.setText(file_path.split('/')[-1])
+                self.basename = os.path.basename(file_path)
+                self.label.setText(self.basename)
     
     def load_metadata(self):
-        try:
-            audio = File(self.music_path)
-            if hasattr(audio, 'tags'):
-                # MP3 文件处理
-                if isinstance(audio.tags, ID3):
-                    # 获取标题
-                    if 'TIT2' in audio.tags:
-                        self.metadata['title'] = str(audio.tags['TIT2'])
-                    # 获取封面
-                    if 'APIC:' in audio.tags:
-                        img_data = audio.tags['APIC:'].data
-                        pixmap = QPixmap()
-                        pixmap.loadFromData(img_data)
-                        scaled_pixmap = pixmap.scaled(150, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        self.label.setPixmap(scaled_pixmap)
-                        self.metadata['cover'] = img_data
-                    
-                    # 尝试不同的歌词标签格式
-                    lyrics_tags = ['USLT::XXX', 'USLT::eng', 'USLT::', 'USLT', 
-                                 'SYLT::XXX', 'SYLT::eng', 'SYLT::', 'SYLT']
-                    
-                    for tag in lyrics_tags:
-                        if tag in audio.tags:
-                            lyrics_frame = audio.tags[tag]
-                            if hasattr(lyrics_frame, 'text'):
-                                self.metadata['lyrics'] = lyrics_frame.text
-                                break
-                            elif hasattr(lyrics_frame, 'lyrics'):
-                                self.metadata['lyrics'] = lyrics_frame.lyrics
-                                break
-                    
-                    # 直接遍历所有标签寻找歌词
-                    if 'lyrics' not in self.metadata:
-                        for key in audio.tags.keys():
-                            if 'USLT' in key or 'SYLT' in key:
-                                print(f"Found lyrics tag: {key}")
-                                print(f"Content: {audio.tags[key]}")
-                                if hasattr(audio.tags[key], 'text'):
-                                    self.metadata['lyrics'] = audio.tags[key].text
-                                    break
-            
-            # 如果没有找到标题，使用文件名
-            if 'title' not in self.metadata:
-                self.metadata['title'] = self.music_path.split('/')[-1]
-                self.label.setText(self.metadata['title'])
-                
-        except Exception as e:
-            print(f"Error loading metadata: {e}")
-            self.label.setText(self.music_path.split('/')[-1])
+        # 在后台线程解析标签，避免阻塞界面
+        worker = MetadataWorker(self.music_path)
+        worker.signals.tagsReady.connect(self.apply_metadata, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(worker)
+    
+    @Slot(str, dict)
+    def apply_metadata(self, music_path, metadata):
+        # 文件已被替换（如拖放），丢弃过期结果
+        if music_path != self.music_path:
+            return
+        self.metadata.update(metadata)
+        # 封面只在卡片可见时解码，其余卡片只保留原始数据
+        if self.isVisible():
+            self.ensure_cover()
+    
+    def ensure_cover(self):
+        if self._cover_loaded or 'cover_bytes' not in self.metadata:
+            return
+        pixmap = get_cover_pixmap(self.music_path + ":embedded", self.metadata['cover_bytes'],
+                                  self._cover_mode)
+        # QPixmap 是隐式共享的，保存下来供当前播放卡片直接复用
+        self.metadata['cover_pixmap'] = pixmap
+        self.label.setPixmap(pixmap)
+        self._cover_loaded = True
+    
+    def set_cover_mode(self, scale_mode):
+        # 缩放方式改变时，从缓存的原始数据重新生成已显示的封面
+        if scale_mode == self._cover_mode:
+            return
+        self._cover_mode = scale_mode
+        if self._cover_loaded:
+            self._cover_loaded = False
+            self.ensure_cover()
 
 class CurrentAlbumTile(AlbumTile):
     def __init__(self, title=""):
@@ -141,10 +233,22 @@ class CurrentAlbumTile(AlbumTile):
         self._slider_pressed = False
 
 class LyricsTile(TileWidget):
+    # 歌词高亮由 state 动态属性决定，样式表只在 lyrics_widget 上设置一次
+    _LYRICS_QSS = ("QLabel{color:#808080;font-size:14px;padding:5px;}"
+                   "QLabel[state='active']{color:white;font-size:16px;font-weight:bold;}")
+    
     def __init__(self):
         super().__init__("Lyrics")
         self.lyrics_lines = []  # [(time_in_ms, lyric_text), ...]
+        self._times = []  # lyrics_lines 中的时间，供 bisect 查找
         self.current_line = 0
+        
+        # positionChanged 触发很频繁，歌词高亮最多每 100ms 更新一次
+        self._pending_pos = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(100)
+        self._timer.timeout.connect(self._apply_position)
         self.setup_ui()
     
     def setup_ui(self):
@@ -152,8 +256,10 @@ class LyricsTile(TileWidget):
         
         # 创建可滚动的歌词显示区域
         self.lyrics_widget = QWidget()
+        self.lyrics_widget.setStyleSheet(self._LYRICS_QSS)
         self.lyrics_layout = QVBoxLayout(self.lyrics_widget)
         self.lyrics_labels = []
+        self._label_index = {}  # {标签: 行号}，用于点击定位
         
         # 创建滚动区域
         self.scroll = QScrollArea()
@@ -176,125 +282,101 @@ class LyricsTile(TileWidget):
     
     def on_lyrics_click(self, event):
         # 获取点击位置对应的歌词标签
-        pos = event.position()  # 使用 position() 替代 pos()
-        for i, label in enumerate(self.lyrics_labels):
-            label_pos = label.mapTo(self.lyrics_widget, QPoint(0, 0))
-            label_rect = QRect(label_pos, label.size())
-            if label_rect.contains(pos.toPoint()):  # 转换为 QPoint
-                if i < len(self.lyrics_lines):
-                    # 发送时间位置给播放器
-                    time_ms = self.lyrics_lines[i][0]
-                    if hasattr(self, 'player'):
-                        self.player.setPosition(time_ms)
-                break
-    
-    def parse_lrc_time(self, time_str):
-        # 解析 [mm:ss.xx] 格式
-        try:
-            minutes, seconds = time_str[1:-1].split(':')
-            total_seconds = float(minutes) * 60 + float(seconds)
-            return int(total_seconds * 1000)  # 转换为毫秒
-        except:
-            return 0
+        label = self.lyrics_widget.childAt(event.position().toPoint())
+        i = self._label_index.get(label, -1)
+        if 0 <= i < len(self.lyrics_lines):
+            # 发送时间位置给播放器
+            time_ms = self.lyrics_lines[i][0]
+            if hasattr(self, 'player'):
+                self.player.setPosition(time_ms)
     
     def parse_lrc(self, lrc_text):
         self.lyrics_lines = []
+        self._times = []
         if not lrc_text:
+            self.update_lyrics_display()
             return
         
-        for line in lrc_text.split('\n'):
-            line = line.strip()
-            if not line or not line.startswith('['):
+        # 对整段文本做一次 finditer，不再逐行切分
+        for match in _LINE_RE.finditer(lrc_text):
+            text = match.group(2).strip()
+            if not text:
                 continue
             
-            # 处理一行可能有多个时间标签的情况
-            time_tags = []
-            text = line
-            while text.startswith('['):
-                time_end = text.find(']')
-                if time_end == -1:
-                    break
-                time_str = text[:time_end + 1]
-                time_ms = self.parse_lrc_time(time_str)
-                if time_ms > 0:
-                    time_tags.append(time_ms)
-                text = text[time_end + 1:].strip()
-            
-            # 为每个时间标签添加歌词
-            for time_ms in time_tags:
-                if text:
-                    self.lyrics_lines.append((time_ms, text))
+            # 一行可能有多个时间标签，为每个时间标签添加歌词
+            for mm, ss in _TS_RE.findall(match.group(1)):
+                self.lyrics_lines.append((int((int(mm) * 60 + float(ss)) * 1000), text))
         
         # 按时间排序
         self.lyrics_lines.sort(key=lambda x: x[0])
+        self._times = [t for t, _ in self.lyrics_lines]
         self.update_lyrics_display()
     
     def update_lyrics_display(self):
-        # 清除现有歌词
-        for label in self.lyrics_labels:
-            self.lyrics_layout.removeWidget(label)
-            label.deleteLater()
-        self.lyrics_labels.clear()
-        
-        # 创建新的歌词标签
-        for _, text in self.lyrics_lines:
-            label = QLabel(text)
-            label.setWordWrap(True)
-            label.setAlignment(Qt.AlignCenter)
-            label.setStyleSheet("""
-                color: #808080;
-                font-size: 14px;
-                padding: 5px;
-            """)
-            self.lyrics_labels.append(label)
-            self.lyrics_layout.addWidget(label)
+        # 取消旧的高亮，下次 update_position 会重新高亮
+        if 0 <= self.current_line < len(self.lyrics_labels):
+            self._set_line_state(self.lyrics_labels[self.current_line], "inactive")
+        self.current_line = -1
         
-        if not self.lyrics_lines:
-            label = QLabel("暂无歌词")
-            label.setAlignment(Qt.AlignCenter)
-            label.setStyleSheet("color: #808080; font-size: 14px;")
-            self.lyrics_labels.append(label)
-            self.lyrics_layout.addWidget(label)
+        texts = [text for _, text in self.lyrics_lines] or ["暂无歌词"]
+        
+        # 复用已有的歌词标签，只创建不足的部分
+        for i, text in enumerate(texts):
+            if i < len(self.lyrics_labels):
+                label = self.lyrics_labels[i]
+                label.setText(text)
+                label.show()
+            else:
+                label = QLabel(text)
+                label.setWordWrap(True)
+                label.setAlignment(Qt.AlignCenter)
+                label.setProperty("state", "inactive")
+                self._label_index[label] = i
+                self.lyrics_labels.append(label)
+                self.lyrics_layout.addWidget(label)
+        
+        # 多余的标签隐藏起来留待下次使用
+        for label in self.lyrics_labels[len(texts):]:
+            label.hide()
+    
+    def _set_line_state(self, label, state):
+        # 修改动态属性后需要重新 polish 才会应用对应样式
+        label.setProperty("state", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
     
     def update_position(self, position):
+        self._pending_pos = position
+        if not self._timer.isActive():
+            self._timer.start()
+    
+    def _apply_position(self):
         if not self.lyrics_lines:
             return
+        position = self._pending_pos
         
         # 查找当前应该高亮的歌词
-        current_line = -1
-        for i, (time, _) in enumerate(self.lyrics_lines):
-            if time > position:
-                break
-            current_line = i
-        
-        if current_line != self.current_line:
-            # 更新高亮
-            for i, label in enumerate(self.lyrics_labels):
-                if i == current_line:
-                    label.setStyleSheet("""
-                        color: white;
-                        font-size: 16px;
-                        font-weight: bold;
-                        padding: 5px;
-                    """)
-                else:
-                    label.setStyleSheet("""
-                        color: #808080;
-                        font-size: 14px;
-                        padding: 5px;
-                    """)
-            
-            # 滚动到当前行
-            if current_line >= 0:
-                label = self.lyrics_labels[current_line]
-                # 计算滚动位置，使当前行居中
-                scroll_pos = label.pos().y() - (self.scroll.height() // 2) + (label.height() // 2)
-                self.scroll.verticalScrollBar().setValue(max(0, scroll_pos))
-            
-            self.current_line = current_line
+        current_line = bisect.bisect_right(self._times, position) - 1
+        if current_line == self.current_line:
+            return
+        
+        # 暂停重绘，让高亮和滚动的修改合并为一次绘制
+        self.scroll.setUpdatesEnabled(False)
+        
+        # 只更新高亮状态发生变化的两行
+        if 0 <= self.current_line < len(self.lyrics_labels):
+            self._set_line_state(self.lyrics_labels[self.current_line], "inactive")
+        if current_line >= 0:
+            label = self.lyrics_labels[current_line]
+            self._set_line_state(label, "active")
+            # 计算滚动位置，使当前行居中
+            scroll_pos = label.pos().y() - (self.scroll.height() // 2) + (label.height() // 2)
+            self.scroll.verticalScrollBar().setValue(max(0, scroll_pos))
+        
+        self.scroll.setUpdatesEnabled(True)
+        self.current_line = current_line
     
     def update_lyrics(self, text):
-        self.current_line = -1
         self.parse_lrc(text)
 
 class ControlsTile(TileWidget):
@@ -399,6 +481,8 @@ class AudioPlayer:
             self.player.play()
 
 class ScrollableAlbumArea(QScrollArea):
+    tileActivated = Signal(str)  # 发送被选中卡片的音乐路径
+    
     def __init__(self):
         super().__init__()
         self.setWidgetResizable(True)
@@ -412,9 +496,17 @@ class ScrollableAlbumArea(QScrollArea):
         self.layout.setSpacing(10)
         self.setWidget(self.container)
         
+        # 三个固定卡槽，翻页时只切换槽内显示的卡片，不重建布局
+        self._slots = []
+        for i in range(3):
+            slot = QStackedWidget()
+            self.layout.addWidget(slot, 0, i)
+            self._slots.append(slot)
+        
         # 当前显示的起始索引
         self.current_index = 0
         self.tiles = []
+        self.tiles_by_path = {}  # {音乐路径: 卡片}
         
         # 动画设置
         self._scroll_pos = 0
@@ -496,27 +588,46 @@ class ScrollableAlbumArea(QScrollArea):
     
     def add_tile(self, tile):
         self.tiles.append(tile)
+        if tile.music_path:
+            self.tiles_by_path[tile.music_path] = tile
+        tile.clicked.connect(lambda music_path, tile=tile: self.on_tile_clicked(tile, music_path))
         self.update_visible_tiles()
     
+    def on_tile_clicked(self, tile, music_path):
+        # 拖放会修改卡片的音乐路径，激活时同步索引
+        self.tiles_by_path[music_path] = tile
+        self.tileActivated.emit(music_path)
+    
     def update_visible_tiles(self):
-        # 清空现有布局
-        for i in reversed(range(self.layout.count())): 
-            self.layout.itemAt(i).widget().setParent(None)
-        
         # 显示当前三张卡片
-        for i in range(3):
-            idx = (self.current_index + i) % len(self.tiles)
-            if idx < len(self.tiles):
-                self.layout.addWidget(self.tiles[idx], 0, i)
+        for i, slot in enumerate(self._slots):
+            if i >= len(self.tiles):
+                break
+            tile = self.tiles[(self.current_index + i) % len(self.tiles)]
+            # 只有中间卡片使用平滑缩放，两侧卡片使用快速缩放
+            tile.set_cover_mode(Qt.SmoothTransformation if i == 1 else Qt.FastTransformation)
+            tile.ensure_cover()
+            old_tile = slot.currentWidget()
+            if old_tile is not tile:
+                # 每个卡槽只保留当前卡片，隐藏页也会参与 QStackedLayout 的尺寸计算
+                if old_tile is not None:
+                    slot.removeWidget(old_tile)
+                    old_tile.setParent(None)
+                # addWidget 会把卡片从原来的卡槽中移出
+                slot.addWidget(tile)
+                slot.setCurrentWidget(tile)
 
 class TilesPlayer(QMainWindow):
+    LOAD_BATCH_SIZE = 8  # 每次事件循环迭代创建的卡片数
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Tiles Music Player")
         self.setMinimumSize(800, 600)
         self.audio_player = AudioPlayer()
         self.setup_ui()
-        self.load_music_library()
+        # 先显示窗口，再在事件循环中加载音乐库
+        QTimer.singleShot(0, self.load_music_library)
     
     def setup_ui(self):
         central = QWidget()
@@ -528,6 +639,7 @@ class TilesPlayer(QMainWindow):
         
         # 替换上排固定专辑为可滚动区域
         self.scroll_area = ScrollableAlbumArea()
+        self.scroll_area.tileActivated.connect(self.play_album)
         layout.addWidget(self.scroll_area, 0, 0, 1, 3)
         
         # 下排：功能区
@@ -545,35 +657,50 @@ class TilesPlayer(QMainWindow):
         layout.addWidget(self.controls, 1, 2)
         
         # 连接音乐播放状态变化
-        self.audio_player.player.sourceChanged.connect(self.on_source_changed)
         self.audio_player.player.mediaStatusChanged.connect(self.on_status_changed)
         
         # 将进度条连接移到这里
         self.current_album.progress.sliderMoved.connect(self.audio_player.player.setPosition)
-        self.audio_player.player.positionChanged.connect(self.current_album.progress.setValue)
         self.audio_player.player.durationChanged.connect(self.current_album.progress.setMaximum)
         
         # 连接播放器到歌词组件
         self.lyrics.player = self.audio_player.player
-        self.audio_player.player.positionChanged.connect(self.lyrics.update_position)
+        
+        # 进度条和歌词共用一个 positionChanged 槽
+        self.audio_player.player.positionChanged.connect(self._on_position)
     
     def load_music_library(self):
-        import os
         music_dir = "data"
         if not os.path.exists(music_dir):
             os.makedirs(music_dir)
             
         supported_formats = ('.mp3', '.wav', '.flac')
-        for file in os.listdir(music_dir):
-            if file.lower().endswith(supported_formats):
-                music_path = os.path.join(music_dir, file)
-                cover_path = None
-                
-                # 不将当前播放的音乐添加到上排
-                if music_path != self.current_album.music_path:
-                    tile = AlbumTile(file, cover_path, music_path)
-                    tile.clicked.connect(self.play_album)
-                    self.scroll_area.add_tile(tile)
+        music_files = []
+        with os.scandir(music_dir) as entries:
+            for entry in entries:
+                # 先按扩展名过滤，再检查文件类型
+                if not entry.name.lower().endswith(supported_formats):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                music_files.append((entry.name, entry.path))
+        
+        self.load_tiles_batch(music_files, 0)
+    
+    def load_tiles_batch(self, music_files, start):
+        # 分批创建卡片，批次之间让事件循环处理绘制和输入
+        for name, music_path in music_files[start:start + self.LOAD_BATCH_SIZE]:
+            cover_path = None
+            
+            # 不将当前播放的音乐添加到上排
+            if music_path != self.current_album.music_path:
+                tile = AlbumTile(name, cover_path, music_path)
+                self.scroll_area.add_tile(tile)
+        
+        start += self.LOAD_BATCH_SIZE
+        if start < len(music_files):
+            QTimer.singleShot(0, lambda: self.load_tiles_batch(music_files, start))
+            return
         
         # 添加空白拖放区域
         empty_tile = AlbumTile("拖放音乐到这里")
@@ -581,34 +708,37 @@ class TilesPlayer(QMainWindow):
     
     def play_album(self, music_path):
         # 查找对应的 tile
-        for tile in self.scroll_area.tiles:
-            if tile.music_path == music_path:
-                # 更新当前播放专辑
-                self.current_album.music_path = music_path
-                self.current_album.label.setText(tile.metadata.get('title', music_path.split('/')[-1]))
-                
-                # 更新封面
-                if 'cover' in tile.metadata:
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(tile.metadata['cover'])
-                    scaled_pixmap = pixmap.scaled(150, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    self.current_album.label.setPixmap(scaled_pixmap)
-                
-                # 更新歌词
-                if 'lyrics' in tile.metadata:
-                    self.lyrics.update_lyrics(tile.metadata['lyrics'])
-                else:
-                    self.lyrics.update_lyrics("暂无歌词")
-                break
+        tile = self.scroll_area.tiles_by_path.get(music_path)
+        if tile:
+            # 更新当前播放专辑
+            self.current_album.music_path = music_path
+            self.current_album.label.setText(tile.metadata.get('title', tile.basename))
+            
+            # 更新封面
+            if 'cover_pixmap' in tile.metadata:
+                self.current_album.label.setPixmap(tile.metadata['cover_pixmap'])
+            elif 'cover_bytes' in tile.metadata:
+                pixmap = get_cover_pixmap(music_path + ":embedded", tile.metadata['cover_bytes'],
+                                          Qt.SmoothTransformation)
+                self.current_album.label.setPixmap(pixmap)
+            
+            # 更新歌词
+            if 'lyrics' in tile.metadata:
+                self.lyrics.update_lyrics(tile.metadata['lyrics'])
+            else:
+                self.lyrics.update_lyrics("暂无歌词")
         
         # 播放音乐
         self.audio_player.playlist = [music_path]
         self.audio_player.current_index = 0
         self.audio_player.load_current_song()
     
-    @Slot()
-    def on_source_changed(self):
-        pass
+    @Slot(int)
+    def _on_position(self, position):
+        # 拖动进度条时不覆盖滑块位置
+        if not self.current_album._slider_pressed:
+            self.current_album.progress.setValue(position)
+        self.lyrics.update_position(position)
     
     @Slot(QMediaPlayer.MediaStatus)
     def on_status_changed(self, status):
@@ -621,6 +751,7 @@ class TilesPlayer(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication([])
+    QPixmapCache.setCacheLimit(20480)  # 20 MB 封面缓存
     window = TilesPlayer()
     window.show()
     app.exec() 
\ No newline at end of file